@@ -8,6 +8,7 @@ import os
 import os.path
 import re
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from typing import Optional, TypeVar
 from wsgiref.util import FileWrapper
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -877,7 +878,16 @@ def hash_barcode(barcode_data: str) -> str:
     We first remove any non-printable characters from the barcode data,
     as some browsers have issues scanning characters in.
     """
-    barcode_data = str(barcode_data).strip()
+    return _hash_barcode_string(str(barcode_data))
+
+
+@lru_cache(maxsize=256)
+def _hash_barcode_string(barcode_data: str) -> str:
+    """Calculate (and cache) the hash for a barcode string.
+
+    The same barcode data is typically hashed multiple times within a single scan request.
+    """
+    barcode_data = barcode_data.strip()
     barcode_data = remove_non_printable_characters(barcode_data)
 
     barcode_hash = hashlib.md5(str(barcode_data).encode())
@@ -902,6 +902,14 @@ class InvenTreeBarcodeMixin(models.Model):
     - barcode_hash : A 'hash' of the assigned barcode data used to improve matching
 
     The barcode_model_type_code() classmethod must be implemented in the model class.
+
+    The result of barcode_model_type() is cached against each model class
+    as the 'barcode_model_label' attribute, which should be used in preference
+    to calling barcode_model_type() directly.
+
+    Note: The label is evaluated by __init_subclass__, which runs before Django
+    has constructed the model '_meta' options. Any override of barcode_model_type()
+    must therefore not rely on cls._meta.
     """
 
     class Meta:
@@ -922,10 +930,18 @@ class InvenTreeBarcodeMixin(models.Model):
     barcode_hash = models.CharField(
         blank=True,
         max_length=128,
+        db_index=True,
         verbose_name=_('Barcode Hash'),
         help_text=_('Unique hash of barcode data'),
     )
 
+    barcode_model_label: str
+
+    def __init_subclass__(cls, **kwargs):
+        """Cache the barcode model type against each subclass."""
+        super().__init_subclass__(**kwargs)
+        cls.barcode_model_label = cls.barcode_model_type()
+
     @classmethod
     def barcode_model_type(cls):
         """Return the model 'type' for creating a custom QR code."""
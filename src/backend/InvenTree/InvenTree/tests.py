@@ -701,6 +701,12 @@ class TestHelpers(TestCase):
         self.assertNotIn(PartCategory, models)
         self.assertNotIn(InvenTreeSetting, models)
 
+        # Each model caches its barcode model type
+        for model in models:
+            self.assertEqual(model.barcode_model_label, model.barcode_model_type())
+
+        self.assertEqual(Part.barcode_model_label, 'part')
+
     def test_test_key(self):
         """Test for the generateTestKey function."""
         tests = {
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.19 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0071_manufacturerpart_notes_supplierpart_notes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='manufacturerpart',
+            name='barcode_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='Unique hash of barcode data', max_length=128, verbose_name='Barcode Hash'),
+        ),
+        migrations.AlterField(
+            model_name='supplierpart',
+            name='barcode_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='Unique hash of barcode data', max_length=128, verbose_name='Barcode Hash'),
+        ),
+    ]
@@ -253,9 +253,7 @@ class PurchaseOrderFilter(OrderFilter):
 
     def filter_part(self, queryset, name, part: Part):
         """Filter by provided Part instance."""
-        orders = part.purchase_orders()
-
-        return queryset.filter(pk__in=[o.pk for o in orders])
+        return queryset.filter(pk__in=part.purchase_order_ids())
 
     supplier_part = rest_filters.ModelChoiceFilter(
         queryset=company.models.SupplierPart.objects.all(),
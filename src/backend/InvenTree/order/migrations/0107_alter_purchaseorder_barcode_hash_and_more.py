@@ -0,0 +1,28 @@
+# Generated by Django 4.2.19 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('order', '0106_purchaseorder_start_date_returnorder_start_date_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='purchaseorder',
+            name='barcode_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='Unique hash of barcode data', max_length=128, verbose_name='Barcode Hash'),
+        ),
+        migrations.AlterField(
+            model_name='returnorder',
+            name='barcode_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='Unique hash of barcode data', max_length=128, verbose_name='Barcode Hash'),
+        ),
+        migrations.AlterField(
+            model_name='salesorder',
+            name='barcode_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='Unique hash of barcode data', max_length=128, verbose_name='Barcode Hash'),
+        ),
+    ]
@@ -129,6 +129,27 @@ class SalesOrderTest(TestCase):
                 order=self.order, part=self.part, quantity=ii
             )
 
+    def test_part_sales_orders(self):
+        """Test that each sales order is only returned once for a given part."""
+        other = SalesOrder.objects.create(customer=self.customer, reference='SO-1235')
+
+        for ii in range(1, 4):
+            SalesOrderLineItem.objects.create(
+                order=self.order, part=self.part, quantity=ii
+            )
+
+        SalesOrderLineItem.objects.create(order=other, part=self.part, quantity=5)
+
+        orders = self.part.sales_orders()
+
+        self.assertEqual(len(orders), 2)
+        self.assertEqual(
+            sorted(o.pk for o in orders), sorted([self.order.pk, other.pk])
+        )
+
+        # The variant part is not included in any orders
+        self.assertEqual(self.variant.sales_orders(), [])
+
     def allocate_stock(self, full=True):
         """Allocate stock to the order."""
         SalesOrderAllocation.objects.create(
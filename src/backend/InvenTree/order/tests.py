@@ -156,6 +156,23 @@ class OrderTest(TestCase, ExchangeRateMixin):
         # Test the total on-order quantity
         self.assertEqual(part.on_order, 1400)
 
+    def test_part_purchase_orders(self):
+        """Test that each purchase order is only returned once for a given part."""
+        part = Part.objects.get(name='M2x4 LPHS')
+
+        # PO-0001 has multiple lines (for different supplier parts) against this part
+        self.assertEqual(
+            PurchaseOrderLineItem.objects.filter(part__part=part, order__pk=1).count(),
+            3,
+        )
+
+        orders = part.purchase_orders()
+
+        self.assertEqual(len(orders), 2)
+        self.assertEqual(sorted(o.pk for o in orders), [1, 2])
+
+        self.assertEqual(sorted(part.purchase_order_ids()), [1, 2])
+
     def test_add_items(self):
         """Test functions for adding line items to an order."""
         order = PurchaseOrder.objects.get(pk=1)
@@ -16,6 +16,9 @@ logger = structlog.get_logger('inventree')
 _part_full_name_template = None
 _part_full_name_template_string = ''
 
+# Set if the template matches the default format (which can be rendered without jinja)
+_part_full_name_template_is_default = False
+
 
 def compile_full_name_template(*args, **kwargs):
     """Recompile the template for rendering the 'full_name' attribute of a Part.
@@ -24,6 +27,7 @@ def compile_full_name_template(*args, **kwargs):
     """
     global _part_full_name_template
     global _part_full_name_template_string
+    global _part_full_name_template_is_default
 
     template_string = get_global_setting('PART_NAME_FORMAT', cache=True)
 
@@ -34,8 +38,13 @@ def compile_full_name_template(*args, **kwargs):
     ):
         return _part_full_name_template
 
+    from common.models import InvenTreeSetting
+
     # Cache the template string
     _part_full_name_template_string = template_string
+    _part_full_name_template_is_default = (
+        template_string == InvenTreeSetting.get_setting_default('PART_NAME_FORMAT')
+    )
 
     env = Environment(
         autoescape=select_autoescape(default_for_string=False, default=False),
@@ -62,7 +71,8 @@ def render_part_full_name(part) -> str:
     """
     template = compile_full_name_template()
 
-    if template:
+    # The default format is rendered directly (below), as this is much faster
+    if template and not _part_full_name_template_is_default:
         try:
             return template.render(part=part)
         except Exception as e:
@@ -72,7 +82,7 @@ def render_part_full_name(part) -> str:
                 e,
             )
 
-    # Fallback to the default format
+    # Default format (also used as a fallback)
     elements = [el for el in [part.IPN, part.name, part.revision] if el]
     return ' | '.join(elements)
 
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.19 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('part', '0132_partparametertemplate_selectionlist'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='part',
+            name='barcode_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='Unique hash of barcode data', max_length=128, verbose_name='Barcode Hash'),
+        ),
+    ]
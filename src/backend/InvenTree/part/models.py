@@ -61,7 +61,6 @@ from InvenTree.helpers import decimal2money, decimal2string, normalize, str2bool
 from order import models as OrderModels
 from order.status_codes import (
     PurchaseOrderStatus,
-    PurchaseOrderStatusGroups,
     SalesOrderStatus,
     SalesOrderStatusGroups,
 )
@@ -172,7 +171,7 @@ class PartCategory(InvenTree.models.InvenTreeTree):
 
         Ensure that the structural parameter cannot get set if products already assigned to the category
         """
-        if self.pk and self.structural and self.partcount(False, False) > 0:
+        if self.pk and self.structural and self.get_parts(cascade=False).exists():
             raise ValidationError(
                 _(
                     'You cannot make this part category structural because some parts '
@@ -220,10 +219,8 @@ class PartCategory(InvenTree.models.InvenTreeTree):
 
     def prefetch_parts_parameters(self, cascade=True):
         """Prefectch parts parameters."""
-        return (
-            self.get_parts(cascade=cascade)
-            .prefetch_related('parameters', 'parameters__template')
-            .all()
+        return self.get_parts(cascade=cascade).prefetch_related(
+            'parameters', 'parameters__template'
         )
 
     def get_unique_parameters(self, cascade=True, prefetch=None):
@@ -2339,26 +2336,25 @@ class Part(
 
     def sales_orders(self):
         """Return a list of sales orders which reference this part."""
-        orders = []
-
-        for line in self.sales_order_line_items.all().prefetch_related('order'):
-            if line.order not in orders:
-                orders.append(line.order)
-
-        return orders
+        return list(OrderModels.SalesOrder.objects.filter(lines__part=self).distinct())
 
     def purchase_orders(self):
         """Return a list of purchase orders which reference this part."""
-        orders = []
+        return list(
+            OrderModels.PurchaseOrder.objects.filter(lines__part__part=self).distinct()
+        )
 
-        for part in self.supplier_parts.all().prefetch_related(
-            'purchase_order_line_items'
-        ):
-            for order in part.purchase_orders():
-                if order not in orders:
-                    orders.append(order)
+    def purchase_order_ids(self):
+        """Return a queryset of IDs for purchase orders which reference this part.
 
-        return orders
+        Use this (rather than purchase_orders) where the order instances are not required.
+        The queryset is lazy, and can be used directly as a subquery (e.g. pk__in=...)
+        """
+        return (
+            OrderModels.PurchaseOrderLineItem.objects.filter(part__part=self)
+            .values_list('order_id', flat=True)
+            .distinct()
+        )
 
     @property
     def on_order(self):
@@ -2367,23 +2363,24 @@ class Part(
         Note that some supplier parts may have a different pack_quantity attribute,
         and this needs to be taken into account!
         """
-        quantity = 0
+        import part.filters
 
-        # Iterate through all supplier parts
-        for sp in self.supplier_parts.all():
-            # Look at any incomplete line item for open orders
-            lines = sp.purchase_order_line_items.filter(
-                order__status__in=PurchaseOrderStatusGroups.OPEN,
-                quantity__gt=F('received'),
-            )
+        if self.pk is None:
+            return 0
 
-            for line in lines:
-                remaining = line.quantity - line.received
+        # Reuse the 'on order' annotation which is applied to the Part API queryset
+        quantity = (
+            Part.objects.filter(pk=self.pk)
+            .annotate(quantity=part.filters.annotate_on_order_quantity())
+            .values_list('quantity', flat=True)
+            .first()
+        )
 
-                if remaining > 0:
-                    quantity += sp.base_quantity(remaining)
+        if not quantity:
+            return 0
 
-        return quantity
+        # Normalize the result (as per SupplierPart.base_quantity)
+        return round(Decimal(quantity), 10).normalize()
 
     def get_parameter(self, name):
         """Return the parameter with the given name.
@@ -827,7 +827,10 @@ class PartSerializer(
 
         Performing database queries as efficiently as possible, to reduce database trips.
         """
-        queryset = queryset.prefetch_related('category', 'default_location')
+        # Join the category directly (already-cached relations are not prefetched again)
+        queryset = queryset.select_related('category').prefetch_related(
+            'default_location'
+        )
 
         # Annotate with the total number of revisions
         queryset = queryset.annotate(revision_count=SubqueryCount('revisions'))
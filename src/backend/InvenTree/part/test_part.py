@@ -8,9 +8,10 @@ from django.core.exceptions import ValidationError
 from django.test import TestCase
 
 from allauth.account.models import EmailAddress
+from jinja2 import Template
 
 import part.settings
-from common.models import NotificationEntry, NotificationMessage
+from common.models import InvenTreeSetting, NotificationEntry, NotificationMessage
 from common.notifications import UIMessageNotification, storage
 from common.settings import get_global_setting, set_global_setting
 from InvenTree import version
@@ -190,6 +191,39 @@ class PartTest(TestCase):
         p = Part.objects.get(pk=100)
         self.assertEqual(str(p), 'BOB | Bob | A2 - Can we build it? Yes we can!')
 
+    def test_full_name(self):
+        """Test rendering of the 'full_name' attribute against the PART_NAME_FORMAT setting."""
+        # The default format must render the same as the jinja template
+        template = Template(InvenTreeSetting.get_setting_default('PART_NAME_FORMAT'))
+
+        for ipn in ['', 'IPN-123']:
+            for revision in ['', 'B']:
+                p = Part(name='Widget', IPN=ipn, revision=revision)
+                self.assertEqual(p.full_name, template.render(part=p))
+
+        p = Part(name='Widget', IPN='IPN-123', revision='B')
+        self.assertEqual(p.full_name, 'IPN-123 | Widget | B')
+
+        p = Part(name='Widget')
+        self.assertEqual(p.full_name, 'Widget')
+
+        # A custom format must be rendered via the template
+        set_global_setting(
+            'PART_NAME_FORMAT', '{{ part.name }} - {{ part.description }}', None
+        )
+
+        p = Part(name='Widget', IPN='IPN-123', description='A widget')
+        self.assertEqual(p.full_name, 'Widget - A widget')
+
+        # Revert to the default format
+        set_global_setting(
+            'PART_NAME_FORMAT',
+            InvenTreeSetting.get_setting_default('PART_NAME_FORMAT'),
+            None,
+        )
+
+        self.assertEqual(p.full_name, 'IPN-123 | Widget')
+
     def test_duplicate(self):
         """Test that we cannot create a "duplicate" Part."""
         n = Part.objects.count()
@@ -296,7 +296,7 @@ class BarcodeAssign(BarcodeView):
         valid_labels = []
 
         for model in plugin.base.barcodes.helper.get_supported_barcode_models():
-            label = model.barcode_model_type()
+            label = model.barcode_model_label
             valid_labels.append(label)
 
             if instance := kwargs.get(label):
@@ -339,7 +339,7 @@ class BarcodeUnassign(BarcodeView):
 
         supported_models = plugin.base.barcodes.helper.get_supported_barcode_models()
 
-        supported_labels = [model.barcode_model_type() for model in supported_models]
+        supported_labels = [model.barcode_model_label for model in supported_models]
         model_names = ', '.join(supported_labels)
 
         matched_labels = []
@@ -360,7 +360,7 @@ class BarcodeUnassign(BarcodeView):
 
         # At this stage, we know that we have received a single valid field
         for model in supported_models:
-            label = model.barcode_model_type()
+            label = model.barcode_model_label
 
             if instance := data.get(label, None):
                 # Check that the user has the required permission
@@ -1,6 +1,8 @@
 """Helper functions for barcode generation."""
 
-from typing import cast
+from typing import Optional, cast
+
+from django.db.models import IntegerField, Value
 
 import structlog
 
@@ -49,11 +51,21 @@ def get_supported_barcode_models() -> list[type[InvenTreeBarcodeMixin]]:
     return InvenTree.helpers_model.getModelsWithMixin(InvenTreeBarcodeMixin)
 
 
+@cache
+def get_supported_barcode_model_labels() -> list[
+    tuple[str, type[InvenTreeBarcodeMixin]]
+]:
+    """Return a list of (model type, model class) pairs for supported barcode models."""
+    return [
+        (model.barcode_model_label, model) for model in get_supported_barcode_models()
+    ]
+
+
 @cache
 def get_supported_barcode_models_map():
     """Return a mapping of barcode model types to the model class."""
     return {
-        model.barcode_model_type(): model for model in get_supported_barcode_models()
+        model.barcode_model_label: model for model in get_supported_barcode_models()
     }
 
 
@@ -64,3 +76,41 @@ def get_supported_barcode_model_codes_map():
         model.barcode_model_type_code(): model
         for model in get_supported_barcode_models()
     }
+
+
+def lookup_barcode_hash(
+    barcode_hash: str,
+) -> Optional[tuple[str, type[InvenTreeBarcodeMixin], InvenTreeBarcodeMixin]]:
+    """Find the model instance which has the provided third-party barcode hash assigned.
+
+    Rather than querying each supported model in turn, a single UNION ALL query
+    is performed across all supported models. If multiple models match,
+    the first model (in supported model order) takes precedence.
+
+    Returns:
+        A tuple of (model type, model class, instance) or None if no match is found
+    """
+    supported_models = get_supported_barcode_model_labels()
+
+    if not supported_models:
+        return None
+
+    queries = [
+        model.objects.filter(barcode_hash=barcode_hash)
+        .order_by()
+        .annotate(barcode_model=Value(idx, output_field=IntegerField()))
+        .values_list('barcode_model', 'pk')
+        for idx, (_label, model) in enumerate(supported_models)
+    ]
+
+    result = queries[0].union(*queries[1:], all=True).order_by('barcode_model')[:1]
+
+    for idx, pk in result:
+        label, model = supported_models[idx]
+
+        try:
+            return label, model, model.objects.get(pk=pk)
+        except model.DoesNotExist:
+            pass
+
+    return None
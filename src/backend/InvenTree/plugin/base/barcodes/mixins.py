@@ -281,10 +281,10 @@ class SupplierBarcodeMixin(BarcodeMixin):
         # Generate possible matches for this barcode
         # Note: Each of these functions can be overridden by the plugin (if necessary)
         matches = {
-            Part.barcode_model_type(): self.get_part(),
-            PurchaseOrder.barcode_model_type(): self.get_purchase_order(),
-            SupplierPart.barcode_model_type(): self.get_supplier_part(),
-            ManufacturerPart.barcode_model_type(): self.get_manufacturer_part(),
+            Part.barcode_model_label: self.get_part(),
+            PurchaseOrder.barcode_model_label: self.get_purchase_order(),
+            SupplierPart.barcode_model_label: self.get_supplier_part(),
+            ManufacturerPart.barcode_model_label: self.get_manufacturer_part(),
         }
 
         data = {}
@@ -83,20 +83,18 @@ class BarcodeAssignMixin(serializers.Serializer):
         super().__init__(*args, **kwargs)
 
         for model in plugin.base.barcodes.helper.get_supported_barcode_models():
-            self.fields[model.barcode_model_type()] = (
-                serializers.PrimaryKeyRelatedField(
-                    queryset=model.objects.all(),
-                    required=False,
-                    allow_null=True,
-                    label=model._meta.verbose_name,
-                )
+            self.fields[model.barcode_model_label] = serializers.PrimaryKeyRelatedField(
+                queryset=model.objects.all(),
+                required=False,
+                allow_null=True,
+                label=model._meta.verbose_name,
             )
 
     @staticmethod
     def get_model_fields():
         """Return a list of model fields."""
         fields = [
-            model.barcode_model_type()
+            model.barcode_model_label
             for model in plugin.base.barcodes.helper.get_supported_barcode_models()
         ]
 
@@ -236,6 +236,58 @@ class BarcodeAPITest(InvenTreeAPITestCase):
             self.unassign_url, {'stockitem': 999999999}, expected_code=400
         )
 
+    def test_lookup_barcode_hash(self):
+        """Test lookup of third-party barcode hash across all supported models."""
+        from InvenTree.helpers import hash_barcode
+        from plugin.base.barcodes.helper import (
+            get_supported_barcode_model_labels,
+            lookup_barcode_hash,
+        )
+
+        barcode_hash = hash_barcode('A-LOOKUP-BARCODE')
+
+        # No model has this barcode assigned
+        self.assertIsNone(lookup_barcode_hash(barcode_hash))
+
+        item = StockItem.objects.get(pk=522)
+        item.assign_barcode(barcode_hash=barcode_hash)
+
+        label, model, instance = lookup_barcode_hash(barcode_hash)
+
+        self.assertEqual(label, 'stockitem')
+        self.assertEqual(model, StockItem)
+        self.assertEqual(instance.pk, item.pk)
+
+        item.unassign_barcode()
+        self.assertIsNone(lookup_barcode_hash(barcode_hash))
+
+        # Assign the same hash to instances of two different models
+        # The earlier model (in supported model order) is given the higher pk,
+        # so that the test does not pass by accident if results are ordered by pk
+        supported_models = [model for _, model in get_supported_barcode_model_labels()]
+
+        self.assertLess(supported_models.index(Part), supported_models.index(StockItem))
+
+        first = Part.objects.order_by('-pk').first()
+        second = StockItem.objects.order_by('pk').first()
+
+        self.assertGreater(first.pk, second.pk)
+
+        first.assign_barcode(barcode_hash=barcode_hash)
+        second.assign_barcode(barcode_hash=barcode_hash)
+
+        # The first supported model takes precedence
+        label, model, instance = lookup_barcode_hash(barcode_hash)
+
+        self.assertEqual(label, 'part')
+        self.assertEqual(model, Part)
+        self.assertEqual(instance.pk, first.pk)
+
+        first.unassign_barcode()
+        second.unassign_barcode()
+
+        self.assertIsNone(lookup_barcode_hash(barcode_hash))
+
     def test_unassign_endpoint(self):
         """Test that the unassign endpoint works as expected."""
         invalid_keys = ['cat', 'dog', 'fish']
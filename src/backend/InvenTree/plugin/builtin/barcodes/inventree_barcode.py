@@ -8,9 +8,9 @@ references model objects actually exist in the database.
 """
 
 import json
-import re
-from typing import cast
+from typing import Optional, cast
 
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 import plugin.base.barcodes.helper
@@ -19,6 +19,45 @@ from InvenTree.models import InvenTreeBarcodeMixin
 from plugin import InvenTreePlugin
 from plugin.mixins import BarcodeMixin, SettingsMixin
 
+# Message returned when a barcode is matched (translated lazily)
+SUCCESS_MESSAGE = _('Found matching item')
+
+# Characters permitted in a short barcode model type code (QR code alphanumeric set)
+SHORT_BARCODE_CODE_CHARS = frozenset('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:')
+
+
+def parse_short_barcode(barcode_data: str, prefix: str) -> Optional[tuple[str, int]]:
+    """Parse a short barcode string with the provided prefix.
+
+    The expected format is <prefix><2 character model type code><pk>
+
+    Returns:
+        A tuple of (model type code, pk) or None if the data does not match the format
+    """
+    if not barcode_data.startswith(prefix):
+        return None
+
+    n = len(prefix)
+    model_type_code = barcode_data[n : n + 2]
+    pk = barcode_data[n + 2 :]
+
+    if len(model_type_code) != 2 or not pk.isdecimal():
+        return None
+
+    if not SHORT_BARCODE_CODE_CHARS.issuperset(model_type_code):
+        return None
+
+    return model_type_code, int(pk)
+
+
+def looks_like_json_object(data: str) -> bool:
+    """Cheap check to determine if the provided string could be a JSON object.
+
+    Avoids invoking the JSON parser for (common) opaque barcode strings.
+    """
+    data = data.strip()
+    return data.startswith('{') and data.endswith('}')
+
 
 class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugin):
     """Builtin BarcodePlugin for matching and generating internal barcodes."""
@@ -48,6 +87,17 @@ class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugi
         },
     }
 
+    def get_cached_setting(self, key, backup_value=None):
+        """Return the value of a plugin setting, using the global cache if enabled.
+
+        These settings are read on every scan / generate operation.
+        Setting values are written to the global cache whenever they are saved,
+        so the cached value remains consistent across worker processes.
+        """
+        return self.get_setting(
+            key, cache=settings.GLOBAL_CACHE_ENABLED, backup_value=backup_value
+        )
+
     def format_matched_response(self, label, model, instance):
         """Format a response for the scanned data."""
         return {label: instance.format_matched_response()}
@@ -59,13 +109,11 @@ class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugi
         """
         # Internal Barcodes - Short Format
         # Attempt to match the barcode data against the short barcode format
-        prefix = cast(str, self.get_setting('SHORT_BARCODE_PREFIX'))
-        if type(barcode_data) is str and (
-            m := re.match(
-                f'^{re.escape(prefix)}([0-9A-Z $%*+-.\\/:]{"{2}"})(\\d+)$', barcode_data
-            )
-        ):
-            model_type_code, pk = m.groups()
+        is_str = isinstance(barcode_data, str)
+
+        prefix = cast(str, self.get_cached_setting('SHORT_BARCODE_PREFIX'))
+        if is_str and (match := parse_short_barcode(barcode_data, prefix)):
+            model_type_code, pk = match
 
             supported_models_map = (
                 plugin.base.barcodes.helper.get_supported_barcode_model_codes_map()
@@ -75,12 +123,12 @@ class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugi
             if model is None:
                 return None
 
-            label = model.barcode_model_type()
+            label = model.barcode_model_label
 
             try:
-                instance = model.objects.get(pk=int(pk))
+                instance = model.objects.get(pk=pk)
                 return self.format_matched_response(label, model, instance)
-            except (ValueError, model.DoesNotExist):
+            except model.DoesNotExist:
                 pass
 
         # Internal Barcodes - JSON Format
@@ -88,62 +136,81 @@ class InvenTreeInternalBarcodePlugin(SettingsMixin, BarcodeMixin, InvenTreePlugi
         # This is the internal JSON barcode representation that InvenTree uses
         barcode_dict = None
 
-        if type(barcode_data) is dict:
+        if isinstance(barcode_data, dict):
             barcode_dict = barcode_data
-        elif type(barcode_data) is str:
+        elif is_str and looks_like_json_object(barcode_data):
             try:
-                barcode_dict = json.loads(barcode_data)
+                data = json.loads(barcode_data)
+
+                if isinstance(data, dict):
+                    barcode_dict = data
             except json.JSONDecodeError:
                 pass
 
-        supported_models = plugin.base.barcodes.helper.get_supported_barcode_models()
-
-        succcess_message = _('Found matching item')
+        if barcode_dict is not None:
+            supported_models_map = (
+                plugin.base.barcodes.helper.get_supported_barcode_models_map()
+            )
 
-        if barcode_dict is not None and type(barcode_dict) is dict:
             # Look for various matches. First good match will be returned
-            for model in supported_models:
-                label = model.barcode_model_type()
-
-                if label in barcode_dict:
-                    try:
-                        pk = int(barcode_dict[label])
-                        instance = model.objects.get(pk=pk)
-
-                        return {
-                            **self.format_matched_response(label, model, instance),
-                            'success': succcess_message,
-                        }
-                    except (ValueError, model.DoesNotExist):
-                        pass
+            for label, value in barcode_dict.items():
+                model = supported_models_map.get(label, None)
+
+                if model is None:
+                    continue
+
+                # Validate the pk value without relying on exception handling
+                if isinstance(value, int):
+                    pk = value
+                elif (isinstance(value, float) and value.is_integer()) or (
+                    isinstance(value, str) and value.strip().isdecimal()
+                ):
+                    pk = int(value)
+                else:
+                    continue
+
+                try:
+                    instance = model.objects.get(pk=pk)
+                except model.DoesNotExist:
+                    continue
+
+                response = self.format_matched_response(label, model, instance)
+                response['success'] = SUCCESS_MESSAGE
+                return response
 
         # External Barcodes (Linked barcodes)
         # Create hash from raw barcode data
         barcode_hash = hash_barcode(barcode_data)
 
         # If no "direct" hits are found, look for assigned third-party barcodes
-        for model in supported_models:
-            label = model.barcode_model_type()
+        match = plugin.base.barcodes.helper.lookup_barcode_hash(barcode_hash)
 
-            instance = model.lookup_barcode(barcode_hash)
+        if match is not None:
+            label, model, instance = match
 
-            if instance is not None:
-                return {
-                    **self.format_matched_response(label, model, instance),
-                    'success': succcess_message,
-                }
+            response = self.format_matched_response(label, model, instance)
+            response['success'] = SUCCESS_MESSAGE
+            return response
 
     def generate(self, model_instance: InvenTreeBarcodeMixin):
         """Generate a barcode for a given model instance."""
-        barcode_format = self.get_setting(
+        barcode_format = self.get_cached_setting(
             'INTERNAL_BARCODE_FORMAT', backup_value='json'
         )
 
         if barcode_format == 'short':
-            prefix = self.get_setting('SHORT_BARCODE_PREFIX')
+            prefix = self.get_cached_setting('SHORT_BARCODE_PREFIX')
             model_type_code = model_instance.barcode_model_type_code()
 
             return f'{prefix}{model_type_code}{model_instance.pk}'
         else:
             # Default = JSON format
-            return json.dumps({model_instance.barcode_model_type(): model_instance.pk})
+            label = model_instance.barcode_model_label
+
+            pk = model_instance.pk
+
+            # Avoid the JSON encoder for integer keys and labels which never require escaping
+            if isinstance(pk, int) and label.isascii() and label.isidentifier():
+                return f'{{"{label}": {pk}}}'
+
+            return json.dumps({label: pk})
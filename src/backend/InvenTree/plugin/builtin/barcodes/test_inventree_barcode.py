@@ -1,5 +1,7 @@
 """Unit tests for InvenTreeBarcodePlugin."""
 
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
 
 import part.models
@@ -294,6 +296,14 @@ class TestInvenTreeBarcode(InvenTreeAPITestCase):
 
         self.assertEqual(response.data['part']['pk'], 5)
 
+        # Integral float values are also accepted
+        response = self.scan({'barcode': '{"part": 5.0}'}, expected_code=200)
+
+        self.assertEqual(response.data['part']['pk'], 5)
+
+        # Non-integral float values are not
+        self.scan({'barcode': '{"part": 5.5}'}, expected_code=400)
+
         # Scan a SupplierPart instance
         response = self.scan({'barcode': '{"supplierpart": 1}'}, expected_code=200)
 
@@ -348,12 +358,72 @@ class TestInvenTreeBarcode(InvenTreeAPITestCase):
 
         self.set_plugin_setting('SHORT_BARCODE_PREFIX', 'INV-')
 
+    @override_settings(GLOBAL_CACHE_ENABLED=True)
+    def test_scan_cached_settings(self):
+        """Test that changes to cached plugin settings are observed by the scanner."""
+        from plugin import registry
+        from plugin.models import PluginSetting
+
+        plugin = registry.get_plugin('inventreebarcode')
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        for prefix in ['TEST', 'ABC-']:
+            self.set_plugin_setting('SHORT_BARCODE_PREFIX', prefix)
+
+            self.assertEqual(plugin.get_cached_setting('SHORT_BARCODE_PREFIX'), prefix)
+
+            response = self.scan({'barcode': f'{prefix}SP1'}, expected_code=200)
+            self.assertEqual(response.data['supplierpart']['pk'], 1)
+
+        # The previous prefix no longer matches
+        self.scan({'barcode': 'TESTSP1'}, expected_code=400)
+
+        # Changes which bypass the cache are not observed (the cached value is used)
+        PluginSetting.objects.filter(
+            key='SHORT_BARCODE_PREFIX', plugin__key='inventreebarcode'
+        ).update(value='XYZ-')
+
+        self.assertEqual(plugin.get_cached_setting('SHORT_BARCODE_PREFIX'), 'ABC-')
+        self.scan({'barcode': 'ABC-SP1'}, expected_code=200)
+
+        self.set_plugin_setting('SHORT_BARCODE_PREFIX', 'INV-')
+
+    def test_parse_short_barcode(self):
+        """Test parsing of short barcode strings."""
+        from plugin.builtin.barcodes.inventree_barcode import parse_short_barcode
+
+        self.assertEqual(parse_short_barcode('INV-SI5', 'INV-'), ('SI', 5))
+        self.assertEqual(parse_short_barcode('INV-PA123', 'INV-'), ('PA', 123))
+        self.assertEqual(parse_short_barcode('SP1', ''), ('SP', 1))
+        self.assertEqual(parse_short_barcode('TEST$:12', 'TEST'), ('$:', 12))
+
+        for data in [
+            'INV-SI',  # Missing pk
+            'INV-S',  # Incomplete model type code
+            'INV-SIx5',  # Non-numeric pk
+            'INV-si5',  # Lowercase model type code
+            'INV-S_5',  # Invalid model type code character
+            'XYZ-SI5',  # Wrong prefix
+            'INV-SI5 ',  # Trailing characters
+        ]:
+            self.assertIsNone(parse_short_barcode(data, 'INV-'))
+
     def test_generation_inventree_json(self):
         """Test JSON barcode generation."""
         item = stock.models.StockLocation.objects.get(pk=5)
         data = self.generate('stocklocation', item.pk, expected_code=200).data
         self.assertEqual(data['barcode'], '{"stocklocation": 5}')
 
+        # Generate directly via the plugin, including an unsaved instance
+        from plugin import registry
+
+        plugin = registry.get_plugin('inventreebarcode')
+
+        self.assertEqual(plugin.generate(item), '{"stocklocation": 5}')
+        self.assertEqual(plugin.generate(part.models.Part(name='x')), '{"part": null}')
+
     def test_generation_inventree_short(self):
         """Test short barcode generation."""
         self.set_plugin_setting('INTERNAL_BARCODE_FORMAT', 'short')
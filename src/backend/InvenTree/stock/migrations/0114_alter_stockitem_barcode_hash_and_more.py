@@ -0,0 +1,23 @@
+# Generated by Django 4.2.19 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock', '0113_stockitem_status_custom_key_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='stockitem',
+            name='barcode_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='Unique hash of barcode data', max_length=128, verbose_name='Barcode Hash'),
+        ),
+        migrations.AlterField(
+            model_name='stocklocation',
+            name='barcode_hash',
+            field=models.CharField(blank=True, db_index=True, help_text='Unique hash of barcode data', max_length=128, verbose_name='Barcode Hash'),
+        ),
+    ]